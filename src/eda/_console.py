@@ -0,0 +1,4 @@
+"""Shared rich console used for all terminal output."""
+from rich.console import Console
+
+console = Console()
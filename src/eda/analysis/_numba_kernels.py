@@ -0,0 +1,29 @@
+"""Numba-compiled kernels, only imported when numba is installed."""
+import numpy as np
+from numba import njit, prange
+
+# Columns are processed in parallel; fastmath flags exclude 'nnan' so NaN checks still hold
+@njit(parallel=True, fastmath={'nsz', 'arcp', 'contract', 'afn', 'reassoc'},
+      error_model='numpy', cache=True)
+def zscore_mask(arr, threshold):
+    """Flag values whose absolute z-score exceeds the threshold, ignoring NaNs."""
+    n, m = arr.shape
+    out = np.zeros((n, m), dtype=np.bool_)
+    for j in prange(m):
+        total = 0.0
+        count = 0
+        for i in range(n):
+            if not np.isnan(arr[i, j]):
+                total += arr[i, j]
+                count += 1
+        if count == 0:
+            continue
+        mu = total / count
+        sq = 0.0
+        for i in range(n):
+            if not np.isnan(arr[i, j]):
+                sq += (arr[i, j] - mu) ** 2
+        sd = np.sqrt(sq / count)
+        for i in range(n):
+            out[i, j] = abs((arr[i, j] - mu) / sd) > threshold
+    return out
@@ -0,0 +1,13 @@
+from typing import Tuple
+import pandas as pd
+from pandas.api import types as ptypes
+
+def classify_columns(df: pd.DataFrame) -> Tuple[pd.Index, pd.Index]:
+    """Split columns into numeric and categorical ones in a single pass over the dtypes."""
+    numeric, categorical = [], []
+    for col, dtype in df.dtypes.items():
+        if ptypes.is_numeric_dtype(dtype) and not ptypes.is_bool_dtype(dtype):
+            numeric.append(col)
+        elif ptypes.is_string_dtype(dtype) or isinstance(dtype, pd.CategoricalDtype):
+            categorical.append(col)
+    return pd.Index(numeric, dtype=df.columns.dtype), pd.Index(categorical, dtype=df.columns.dtype)
@@ -1,35 +1,231 @@
+import warnings
 import numpy as np
-from scipy import stats
 import pandas as pd
-from typing import Dict, Any, Tuple
+from pandas.api import types as ptypes
+from typing import Dict, Any, Iterable, Tuple
 
-def calculate_correlations(df: pd.DataFrame) -> pd.DataFrame:
-    """Calculate correlation matrix for numeric columns."""
-    numeric_cols = df.select_dtypes(include=['int64', 'float64'])
-    return numeric_cols.corr()
+# scipy.stats and the optional numba kernels are slow to import, so they are
+# loaded inside the functions that need them
+
+# Importing numba and loading the cached kernel takes ~0.4 s, which the kernel only
+# wins back on arrays with at least this many elements
+NUMBA_MIN_SIZE = 50_000_000
+
+SUMMARY_ROWS = ['count', 'unique', 'top', 'freq', 'mean', 'std', 'min', '25%', '50%', '75%', 'max']
+
+def numeric_array(numeric_cols: pd.DataFrame) -> np.ndarray:
+    """
+    Convert numeric columns to a float ndarray with NaN for missing values.
+    
+    Frames made up entirely of float32 columns stay in float32, halving the memory
+    traffic of the reductions and matrix products run over them.
+    """
+    all_float32 = len(numeric_cols.columns) > 0 and (numeric_cols.dtypes == np.float32).all()
+    return numeric_cols.to_numpy(dtype=np.float32 if all_float32 else np.float64, na_value=np.nan)
+
+def calculate_correlations(df: pd.DataFrame, method: str = 'pearson') -> pd.DataFrame:
+    """Calculate correlation matrix for numeric columns.
+    
+    Supports 'pearson', 'spearman' and 'kendall' correlation methods. Missing values are
+    handled pairwise, like DataFrame.corr().
+    """
+    numeric_cols = df.select_dtypes(include=[np.number])
+    cols = numeric_cols.columns
+    arr = numeric_array(numeric_cols)
+    
+    # Missing values need pandas' pairwise-complete handling; complete data goes
+    # through a single BLAS call below
+    if np.isnan(arr).any():
+        return pd.DataFrame(arr, columns=cols).corr(method=method)
+    
+    from scipy import stats
+    
+    if method == 'kendall':
+        return _pairwise_correlations(arr, cols, lambda x, y: stats.kendalltau(x, y)[0])
+    if method == 'spearman':
+        arr = stats.rankdata(arr, axis=0).astype(arr.dtype, copy=False)
+    elif method != 'pearson':
+        raise ValueError(f"Unsupported correlation method: {method}")
+    
+    # Unscaled covariance via one GEMM in the array's own precision (np.cov always
+    # upcasts to float64); the scale factor cancels out in the normalization below
+    arr = arr - arr.mean(axis=0)
+    cov = arr.T @ arr
+    
+    # Normalize in place rather than dividing by an outer product of the stddevs
+    with np.errstate(divide='ignore', invalid='ignore'):
+        d = np.sqrt(1.0 / np.diag(cov))
+        cov *= d
+        cov *= d[:, None]
+    np.clip(cov, -1, 1, out=cov)
+    return pd.DataFrame(cov, index=cols, columns=cols)
+
+def _pairwise_correlations(arr: np.ndarray, cols: pd.Index, metric) -> pd.DataFrame:
+    """Build a symmetric correlation matrix, evaluating only the upper triangle."""
+    n = arr.shape[1]
+    m = np.empty((n, n))
+    np.fill_diagonal(m, 1.0)
+    for i in range(n):
+        for j in range(i + 1, n):
+            m[i, j] = m[j, i] = metric(arr[:, i], arr[:, j])
+    return pd.DataFrame(m, index=cols, columns=cols)
 
 def perform_statistical_tests(df: pd.DataFrame) -> str:
     """Perform basic statistical tests on the data."""
     output_lines = []
     
-    # Normality tests for numeric columns
-    numeric_cols = df.select_dtypes(include=['int64', 'float64'])
-    for col in numeric_cols:
-        stat, p_value = stats.normaltest(df[col].dropna())
+    from scipy import stats
+    
+    # Normality tests for all numeric columns in one call
+    numeric_cols = df.select_dtypes(include=[np.number])
+    arr = numeric_cols.to_numpy(dtype=np.float64, na_value=np.nan)
+    with warnings.catch_warnings():
+        # Columns with too few values get NaN results, reported below
+        warnings.simplefilter('ignore', RuntimeWarning)
+        statistics, p_values = stats.normaltest(arr, axis=0, nan_policy='omit')
+    for col, stat, p_value in zip(numeric_cols.columns, statistics, p_values):
         output_lines.append(f"{col} Normality Test:")
+        if np.isnan(p_value):
+            output_lines.append("  Result: Insufficient data (at least 8 non-missing values are needed)")
+            continue
         output_lines.append(f"  Statistic: {stat:.4f}")
         output_lines.append(f"  P-value: {p_value:.4f}")
         output_lines.append(f"  Result: {'Normal' if p_value > 0.05 else 'Not normal'}")
     
     return "\n".join(output_lines)
 
+def _zscore_mask_numpy(arr: np.ndarray, threshold: float) -> np.ndarray:
+    """Flag values whose absolute z-score exceeds the threshold, ignoring NaNs."""
+    # Z-scores for every column in a single broadcasted pass
+    with np.errstate(divide='ignore', invalid='ignore'), warnings.catch_warnings():
+        # All-NaN columns simply get no outliers
+        warnings.simplefilter('ignore', RuntimeWarning)
+        mu = np.nanmean(arr, axis=0)
+        sd = np.nanstd(arr, axis=0)
+        z = np.abs((arr - mu) / sd)
+    return z > threshold
+
+def _zscore_mask(arr: np.ndarray, threshold: float) -> np.ndarray:
+    """Flag outliers with the Numba kernel for large arrays when numba is installed, else with NumPy."""
+    if arr.size < NUMBA_MIN_SIZE:
+        return _zscore_mask_numpy(arr, threshold)
+    try:
+        from eda.analysis._numba_kernels import zscore_mask
+    except ImportError:
+        return _zscore_mask_numpy(arr, threshold)
+    return zscore_mask(arr, threshold)
+
 def detect_outliers(df: pd.DataFrame, threshold: float = 3.0) -> Dict[str, np.ndarray]:
     """Detect outliers using Z-score method."""
-    outliers = {}
-    numeric_cols = df.select_dtypes(include=['int64', 'float64'])
+    numeric_cols = df.select_dtypes(include=[np.number])
+    cols = numeric_cols.columns
+    arr = numeric_array(numeric_cols)
+    mask = _zscore_mask(arr, threshold)
+    
+    return {col: arr[mask[:, i], i] for i, col in enumerate(cols)}
+
+def summary_statistics(df: pd.DataFrame) -> pd.DataFrame:
+    """Summarize all columns like describe(include='all') using batched NumPy reductions."""
+    numeric_cols = df.select_dtypes(include=[np.number])
+    datetime_mask = [ptypes.is_datetime64_any_dtype(dtype) for dtype in df.dtypes]
+    datetime_cols = df.loc[:, datetime_mask]
+    other_cols = df.loc[:, ~(df.columns.isin(numeric_cols.columns) | np.array(datetime_mask, dtype=bool))]
+    parts = []
+    
+    if numeric_cols.shape[1]:
+        # Float32 frames are reduced in single precision
+        arr = numeric_array(numeric_cols)
+        if len(arr) == 0:
+            # No rows: a zero count and NaN for everything else, as describe() reports
+            arr = np.full((1, arr.shape[1]), np.nan, dtype=arr.dtype)
+        with warnings.catch_warnings():
+            # All-NaN columns simply summarize to NaN
+            warnings.simplefilter('ignore', RuntimeWarning)
+            stacked = np.vstack([
+                np.count_nonzero(~np.isnan(arr), axis=0),
+                np.nanmean(arr, axis=0),
+                np.nanstd(arr, axis=0, ddof=1),
+                np.nanmin(arr, axis=0),
+                np.nanpercentile(arr, [25, 50, 75], axis=0),
+                np.nanmax(arr, axis=0),
+            ])
+        parts.append(pd.DataFrame(stacked, index=['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max'],
+                                  columns=numeric_cols.columns))
+    
+    if datetime_cols.shape[1]:
+        # Datetimes get count, mean, min, percentiles and max (no std), as describe() reports them
+        parts.append(datetime_cols.describe())
+    
+    if other_cols.shape[1]:
+        # One value_counts per column yields count, unique, top and freq together
+        columns = {}
+        for col in other_cols.columns:
+            counts = other_cols[col].value_counts()
+            # Unused categories of a Categorical are counted as zero; describe() leaves them out
+            counts = counts[counts > 0]
+            if len(counts):
+                columns[col] = [counts.sum(), len(counts), counts.index[0], counts.iloc[0]]
+            else:
+                columns[col] = [0, 0, np.nan, np.nan]
+        parts.append(pd.DataFrame(columns, index=['count', 'unique', 'top', 'freq']))
+    
+    if not parts:
+        return pd.DataFrame()
+    summary = pd.concat(parts, axis=1)
+    return summary.reindex(index=[row for row in SUMMARY_ROWS if row in summary.index], columns=df.columns)
+
+def streaming_summary(chunks: Iterable[pd.DataFrame]) -> Tuple[pd.DataFrame, int, pd.Series, pd.DataFrame]:
+    """
+    Summarize data too large for memory from an iterable of chunks.
+    
+    Only running count/sum/sum of squares/min/max per numeric column and null counts
+    per column are kept between chunks, so percentiles and unique/top/freq are omitted.
+    
+    Returns:
+        Tuple of the first chunk (as a sample for further analysis), the total row
+        count, null counts per column and the summary statistics.
+    """
+    sample = None
+    n_rows = 0
+    for chunk in chunks:
+        numeric_cols = chunk.select_dtypes(include=[np.number])
+        arr = numeric_cols.to_numpy(dtype=np.float64, na_value=np.nan)
+        nulls = chunk.isna().sum().to_numpy()
+        with warnings.catch_warnings():
+            # All-NaN columns within a chunk leave min/max as NaN
+            warnings.simplefilter('ignore', RuntimeWarning)
+            chunk_min = np.nanmin(arr, axis=0)
+            chunk_max = np.nanmax(arr, axis=0)
+        if sample is None:
+            sample = chunk
+            numeric_names = numeric_cols.columns
+            count = np.zeros(arr.shape[1])
+            total = np.zeros(arr.shape[1])
+            total_sq = np.zeros(arr.shape[1])
+            minimum = chunk_min
+            maximum = chunk_max
+            missing = np.zeros(chunk.shape[1], dtype=np.int64)
+        else:
+            minimum = np.fmin(minimum, chunk_min)
+            maximum = np.fmax(maximum, chunk_max)
+        n_rows += len(chunk)
+        missing += nulls
+        count += np.count_nonzero(~np.isnan(arr), axis=0)
+        total += np.nansum(arr, axis=0)
+        total_sq += np.nansum(arr * arr, axis=0)
+    
+    if sample is None:
+        return pd.DataFrame(), 0, pd.Series(dtype=np.int64), pd.DataFrame()
     
-    for col in numeric_cols:
-        z_scores = np.abs(stats.zscore(df[col].dropna()))
-        outliers[col] = df[col][z_scores > threshold]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = total / count
+        var = (total_sq - count * mean * mean) / (count - 1)
+    std = np.sqrt(np.maximum(var, 0))
     
-    return outliers
+    missing = pd.Series(missing, index=sample.columns)
+    numeric_summary = pd.DataFrame(np.vstack([count, mean, std, minimum, maximum]),
+                                   index=['count', 'mean', 'std', 'min', 'max'], columns=numeric_names)
+    other_counts = (n_rows - missing[~sample.columns.isin(numeric_names)]).to_frame('count').T
+    summary = pd.concat([numeric_summary, other_counts], axis=1)
+    summary = summary.reindex(index=[row for row in SUMMARY_ROWS if row in summary.index], columns=sample.columns)
+    return sample, n_rows, missing, summary
@@ -1,32 +1,41 @@
-import pandas as pd
 import rich_click as click
-from eda.core import analyze_data, get_sheets_list
-from eda.data_readers.google_sheets_reader import GoogleSheetsReader
 import shutil
 from pathlib import Path
-from pyfiglet import Figlet
-import gspread
-from rich.console import Console
-from rich.markdown import Markdown
+from typing import TYPE_CHECKING, Callable, Optional, Tuple
+from eda._console import console
+
+# Heavy dependencies (pandas, gspread, google-auth, the analysis modules) are
+# imported inside the commands that need them to keep CLI startup fast.
+if TYPE_CHECKING:
+    import pandas as pd
+    from rich.markdown import Markdown
 
 # Use Rich markup
 click.rich_click.USE_RICH_MARKUP = True
 
-console = Console()
+# 'EDA Tool' rendered with pyfiglet's slant font, shipped pre-rendered so
+# startup doesn't pay for loading and rendering the font
+BANNER_TEXT = r"""
+    __________  ___       ______            __
+   / ____/ __ \/   |     /_  __/___  ____  / /
+  / __/ / / / / /| |      / / / __ \/ __ \/ / 
+ / /___/ /_/ / ___ |     / / / /_/ / /_/ / /  
+/_____/_____/_/  |_|    /_/  \____/\____/_/
+""".strip('\n')
+
+def _build_banner() -> str:
+    """Apply a rainbow color effect to the banner text."""
+    colors = ['red', 'yellow', 'green', 'cyan', 'blue', 'magenta']
+    return "".join(
+        f"[{colors[i % len(colors)]}]{line}[/]\n"
+        for i, line in enumerate(BANNER_TEXT.split('\n'))
+    )
+
+_BANNER = _build_banner()
 
 def print_banner():
     """Print a cool ASCII art banner with a rainbow color effect."""
-    f = Figlet(font='slant')
-    banner_text = f.renderText('EDA Tool').rstrip()
-    
-    # Apply rainbow color effect
-    colors = ['red', 'yellow', 'green', 'cyan', 'blue', 'magenta']
-    colored_banner = ""
-    for i, line in enumerate(banner_text.split('\n')):
-        color = colors[i % len(colors)]
-        colored_banner += f"[{color}]{line}[/]\n"
-    
-    console.print(colored_banner, markup=True)
+    console.print(_BANNER, markup=True)
     console.print("[bold]Exploratory Data Analysis Tool[/]", markup=True)
 
 @click.group(invoke_without_command=True)
@@ -68,12 +77,15 @@ def setup(client_secrets_file):
 
 def authenticate_google_sheets():
     """Authenticate and cache Google Sheets credentials."""
+    import gspread
+    from eda.data_readers.google_sheets_reader import GoogleSheetsReader
+    
     reader = GoogleSheetsReader()
     credentials = reader.get_google_credentials()
     gc = gspread.authorize(credentials)
     print("Google Sheets authentication successful.")
 
-def select_sheet(source: str) -> int:
+def select_sheet(source: str) -> Tuple[int, Optional['pd.ExcelFile']]:
     """
     Interactive sheet selector for Google Sheets and Excel files.
     
@@ -81,19 +93,22 @@ def select_sheet(source: str) -> int:
         source: Google Sheets ID or Excel file path
         
     Returns:
-        Selected sheet index
+        Selected sheet index and, for Excel files, the opened workbook so it
+        can be reused when reading the sheet
     """
+    workbook = None
     if source.startswith('gs://'):
-        sheet_id = source.replace('gs://', '')
-        reader = GoogleSheetsReader()
-        credentials = reader.get_google_credentials()
-        gc = gspread.authorize(credentials)
-        spreadsheet = gc.open_by_key(sheet_id)
+        from eda.core import get_sheets_list
+        from eda.data_readers.google_sheets_reader import GoogleSheetsReader
         
+        spreadsheet = GoogleSheetsReader().open_spreadsheet(source)
         sheets = get_sheets_list(spreadsheet)
     else:
-        xls = pd.ExcelFile(source)
-        sheets = [(i, sheet) for i, sheet in enumerate(xls.sheet_names)]
+        import pandas as pd
+        from eda.data_readers.xlsx_reader import EXCEL_ENGINE
+        
+        workbook = pd.ExcelFile(source, engine=EXCEL_ENGINE)
+        sheets = [(i, sheet) for i, sheet in enumerate(workbook.sheet_names)]
     
     console.print("\n[bold green]Available sheets:[/]", markup=True)
     for idx, title in sheets:
@@ -105,11 +120,31 @@ def select_sheet(source: str) -> int:
             sheet_idx = int(sheet_idx)
             if 0 <= sheet_idx < len(sheets):
                 console.print(f"\n[bold green]Selected sheet:[/] {sheets[sheet_idx][1]}", markup=True)
-                return sheet_idx
+                return sheet_idx, workbook
         except ValueError:
             pass
         console.print("[bold red]Invalid selection. Please try again.[/]", markup=True)
 
+def _markdown_preview() -> Tuple[Callable[[str], None], Callable[[], 'Markdown']]:
+    """
+    Build the on_token callback and the renderable for a live preview of streamed LLM output.
+    
+    The callback only collects tokens, so reading the stream never waits on rendering. Live
+    calls the renderable at its own refresh rate, and the Markdown is only re-parsed when
+    tokens arrived since the previous refresh.
+    """
+    from rich.markdown import Markdown
+    
+    tokens = []
+    rendered = {'count': -1, 'markdown': None}
+    def render() -> Markdown:
+        count = len(tokens)
+        if count != rendered['count']:
+            rendered['count'] = count
+            rendered['markdown'] = Markdown("".join(tokens[:count]))
+        return rendered['markdown']
+    return tokens.append, render
+
 @main.command()
 @click.argument('source')
 @click.option('--output', '-o', help='Output file for the analysis')
@@ -119,7 +154,8 @@ def select_sheet(source: str) -> int:
 @click.option('--viz', is_flag=True, help='Generate interactive visualizations')
 @click.option('--prompt', help='Specific prompt template to use (default: auto-detect)')
 @click.option('--advanced-stats', is_flag=True, help='Include advanced statistical analysis')
-def analyze(source, output, sheet, llm, model, viz, prompt, advanced_stats):
+@click.option('--all-sheets', is_flag=True, help='Analyze every sheet in parallel (for Google Sheets and Excel files)')
+def analyze(source, output, sheet, llm, model, viz, prompt, advanced_stats, all_sheets):
     """
     Analyze a data file and generate summary statistics.
     
@@ -130,25 +166,55 @@ def analyze(source, output, sheet, llm, model, viz, prompt, advanced_stats):
     Example:
         eda analyze data.csv
         eda analyze data.xlsx --sheet 1
+        eda analyze data.xlsx --all-sheets
         eda analyze data.csv --llm --viz
         eda analyze data.csv --advanced-stats
         eda analyze gs://1234567890abcdef --llm --model codellama --viz --advanced-stats
     """
-    if (source.startswith('gs://') or source.endswith('.xlsx')) and sheet is None:
-        sheet = select_sheet(source)
+    from rich.markdown import Markdown
+    from eda.core import analyze_all_sheets, analyze_data
+    
+    options = dict(llm=llm, model=model, viz=viz, prompt_type=prompt, advanced_stats=advanced_stats)
+    if all_sheets:
+        if not (source.startswith('gs://') or source.endswith('.xlsx')):
+            raise click.BadParameter("only Excel (.xlsx) files and Google Sheets (gs://) have sheets to analyze",
+                                     param_hint="'--all-sheets'")
+        if sheet is not None:
+            raise click.BadParameter("cannot be combined with --sheet", param_hint="'--all-sheets'")
+        analyses = analyze_all_sheets(source, **options)
+    else:
+        workbook = None
+        if (source.startswith('gs://') or source.endswith('.xlsx')) and sheet is None:
+            sheet, workbook = select_sheet(source)
+        
+        if llm:
+            from rich.live import Live
+            
+            # Preview the LLM output while it streams in; it is printed in full with the report
+            on_token, render = _markdown_preview()
+            with Live(get_renderable=render, console=console, transient=True):
+                result, llm_output = analyze_data(source, sheet or 0, workbook=workbook,
+                                                  on_token=on_token, **options)
+        else:
+            result, llm_output = analyze_data(source, sheet or 0, workbook=workbook, **options)
+        analyses = [(None, result, llm_output)]
     
-    result, llm_output = analyze_data(source, sheet or 0, llm=llm, model=model, viz=viz, 
-                                    prompt_type=prompt, advanced_stats=advanced_stats)
     if output:
         with open(output, 'w') as f:
-            f.write(result)
-            if llm_output:
-                f.write("\n\nLLM Analysis:\n")
-                f.write(llm_output)
+            for sheet_name, result, llm_output in analyses:
+                if sheet_name is not None:
+                    f.write(f"\n\nSheet: {sheet_name}\n")
+                f.write(str(result))
+                if llm_output:
+                    f.write("\n\nLLM Analysis:\n")
+                    f.write(llm_output)
     else:
-        console.print(result, markup=True)
-        if llm_output:
-            console.print(Markdown(llm_output))
+        for sheet_name, result, llm_output in analyses:
+            if sheet_name is not None:
+                console.print(f"\n[bold magenta]Sheet: {sheet_name}[/]", markup=True)
+            console.print(result, markup=True)
+            if llm_output:
+                console.print(Markdown(llm_output))
 
 if __name__ == "__main__":
     import argparse
@@ -1,18 +1,30 @@
 """Core functionality for EDA tool."""
-from typing import List, Tuple
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+import os
 import webbrowser
 import tempfile
-from rich.console import Console
-import gspread
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import cache, lru_cache, partial
+import pandas as pd
+from rich.markup import escape
+from eda._console import console
+from eda.analysis.column_types import classify_columns
 from eda.data_readers import get_data_reader
-from eda.llm.llm_analysis import get_llm_analysis, detect_data_type
+from eda.data_readers.google_sheets_reader import GoogleSheetsReader
+from eda.data_readers.xlsx_reader import EXCEL_ENGINE
+from eda.llm.llm_analysis import build_llm_prompt, generate_batch, get_llm_analysis, detect_data_type, is_trivial
 from eda.visualizations.plotly_visualizations import create_visualizations
-from eda.analysis.statistical_analysis import calculate_correlations, perform_statistical_tests, detect_outliers
+from eda.analysis.statistical_analysis import (
+    calculate_correlations, perform_statistical_tests, detect_outliers, summary_statistics, streaming_summary
+)
 
-# Create console instance for rich output
-console = Console()
+if TYPE_CHECKING:
+    import gspread
 
-def get_sheets_list(spreadsheet: gspread.Spreadsheet) -> List[Tuple[int, str]]:
+# Files larger than this are summarized in chunks instead of loaded whole
+LARGE_FILE_BYTES = 500 * 1024 ** 2
+
+def get_sheets_list(spreadsheet: 'gspread.Spreadsheet') -> List[Tuple[int, str]]:
     """
     Get list of available sheets in the spreadsheet.
     
@@ -24,11 +36,59 @@ def get_sheets_list(spreadsheet: gspread.Spreadsheet) -> List[Tuple[int, str]]:
     """
     return [(i, sheet.title) for i, sheet in enumerate(spreadsheet.worksheets())]
 
+@lru_cache(maxsize=64)
+def _underline(title: str) -> str:
+    """Underline for a section title; section titles repeat across analyses."""
+    return '=' * len(title)
+
 def format_section(title: str, content: str) -> str:
     """Format a section with title and content."""
-    return f"\n[bold green]{title}[/]\n{'='*len(title)}\n{content}"
+    return f"\n[bold green]{title}[/]\n{_underline(title)}\n{content}"
+
+class AnalysisReport:
+    """
+    Analysis output whose sections are only computed when they are rendered.
+    
+    Sections are registered as builder callables and materialized (once) on first
+    access, so work for output that is never displayed or written is skipped.
+    """
+    
+    def __init__(self):
+        self._builders: Dict[str, Callable[[], str]] = {}
+        self._sections: Dict[str, str] = {}
+    
+    def add(self, name: str, build: Callable[[], str]) -> None:
+        """Register a section builder under the given name."""
+        self._builders[name] = build
+    
+    def section(self, name: str) -> str:
+        """Return the rendered section, building it on first access."""
+        if name not in self._sections:
+            try:
+                self._sections[name] = self._builders[name]()
+            except Exception as e:
+                self._sections[name] = f"[bold red]Error analyzing file: {str(e)}[/]"
+        return self._sections[name]
+    
+    def __str__(self) -> str:
+        return "\n".join(self.section(name) for name in self._builders)
+    
+    def __rich__(self) -> str:
+        return str(self)
 
-def analyze_data(source, sheet_index=0, llm=False, model='llama3.2', viz=False, prompt_type=None, advanced_stats=False):
+def render_visualizations(df: pd.DataFrame, missing: Optional[pd.Series] = None,
+                          columns: Optional[Tuple[pd.Index, pd.Index]] = None) -> str:
+    """Write the visualization dashboard to a temporary HTML file and open it in the browser."""
+    fig = create_visualizations(df, missing, columns)
+    # Load plotly.js from the CDN (and the browser cache) instead of embedding ~3 MB of it
+    html = fig.to_html(include_plotlyjs='cdn', full_html=True, validate=False)
+    with tempfile.NamedTemporaryFile(delete=False, suffix='.html') as f:
+        f.write(html.encode())
+    webbrowser.open(f'file://{f.name}')
+    return f.name
+
+def analyze_data(source, sheet_index=0, llm=False, model='llama3.2', viz=False, prompt_type=None, advanced_stats=False,
+                 workbook=None, on_token=None, defer_llm=False):
     """
     Analyze the data from the given source and return the analysis result and LLM output.
     
@@ -40,62 +100,147 @@ def analyze_data(source, sheet_index=0, llm=False, model='llama3.2', viz=False,
         viz (bool): Whether to generate interactive visualizations.
         prompt_type (str): Specific prompt template to use.
         advanced_stats (bool): Whether to include advanced statistical analysis.
+        workbook (pd.ExcelFile): Already opened Excel workbook to read from, if any.
+        on_token (Callable[[str], None]): Called with each piece of LLM output as it is generated.
+        defer_llm (bool): Only build the LLM prompt and return it in place of the LLM output,
+            so the caller can generate responses for several analyses in one batch.
     
     Returns:
-        Tuple[str, str]: The analysis result and LLM output.
+        Tuple[AnalysisReport, str]: The lazily rendered analysis result and LLM output.
+        On failure the analysis result is an error message string.
     """
     try:
-        reader = get_data_reader(source)
-        df = reader.read_data(source, sheet_index)
+        reader = get_data_reader(source, workbook)
+        report = AnalysisReport()
+        
+        # Readers without a streaming path would load the whole file anyway
+        if reader.supports_streaming and os.path.isfile(source) and os.path.getsize(source) > LARGE_FILE_BYTES:
+            # Stream files that may not fit in memory; further analysis runs on the first chunk
+            chunks = reader.iter_chunks(source, sheet_index)
+            df, n_rows, streamed_missing, streamed_summary = streaming_summary(chunks)
+            shape = (n_rows, df.shape[1])
+            overview = (f"Shape: [yellow]{shape}[/]\n[yellow]Large file: statistics were computed in chunks; "
+                        f"other analyses use the first {len(df)} rows.[/]")
+            get_missing = lambda: streamed_missing
+            get_summary = lambda: streamed_summary
+        else:
+            df = reader.read_data(source, sheet_index)
+            overview = f"Shape: [yellow]{df.shape}[/]"
+            get_missing = lambda: df.isna().sum()
+            get_summary = lambda: summary_statistics(df)
+        
+        # Computed once and shared between the report, the LLM prompt and the visualizations
+        missing_counts = cache(get_missing)
+        column_kinds = cache(lambda: classify_columns(df))
+        dtypes_text = cache(lambda: df.dtypes.to_string())
+        summary = cache(get_summary)
+        summary_text = cache(lambda: summary().to_string())
         
         # Dataset shape with color
-        dataset_overview = format_section("Dataset Overview", f"Shape: [yellow]{df.shape}[/]")
+        report.add('overview', lambda: format_section("Dataset Overview", overview))
         
-        # Column information section
-        column_info = format_section("Column Information", df.dtypes.to_string())
+        # Column information section; column names and Arrow dtype names such as
+        # 'timestamp[s][pyarrow]' must not be read as markup
+        report.add('columns', lambda: format_section("Column Information", escape(dtypes_text())))
         
         # Missing values with highlighting
-        missing_values_content = ""
-        for col, count in df.isnull().sum().items():
-            color = "red" if count > 0 else "green"
-            missing_values_content += f"\n{col}: [{color}]{count}[/]"
-        missing_values = format_section("Missing Values", missing_values_content)
+        def missing_values():
+            counts = missing_counts().to_numpy()
+            lines = [f"\n{escape(str(col))}: [{'red' if n else 'green'}]{n}[/]" for col, n in zip(df.columns, counts)]
+            return format_section("Missing Values", "".join(lines))
+        report.add('missing', missing_values)
         
         # Summary statistics
-        summary_stats = format_section("Summary Statistics", df.describe(include='all').to_string())
+        report.add('summary', lambda: format_section("Summary Statistics", escape(summary_text())))
         
-        output = [dataset_overview, column_info, missing_values, summary_stats]
-        
-        if viz:
-            fig = create_visualizations(df)
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.html') as f:
-                fig.write_html(f.name)
-                webbrowser.open(f'file://{f.name}')
-                output.append("\n[magenta]Visualizations opened in your browser.[/]")
-        
-        if advanced_stats:
-            # Add statistical analysis sections
-            correlations = calculate_correlations(df)
-            stat_tests = perform_statistical_tests(df)
-            outliers = detect_outliers(df)
+        # LLM (network-bound) and visualization rendering run in the background
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            llm_future = None
+            # Empty data leaves nothing for the model to analyze, so no request is made
+            if llm and not is_trivial(df):
+                data_type = prompt_type or detect_data_type(df, column_kinds())
+                if defer_llm:
+                    llm_future = executor.submit(lambda: build_llm_prompt(df, data_type,
+                                                                          stats_summary=summary(),
+                                                                          dtypes_str=dtypes_text()))
+                else:
+                    llm_future = executor.submit(lambda: get_llm_analysis(df, model, prompt_type=data_type,
+                                                                          stats_summary=summary(),
+                                                                          dtypes_str=dtypes_text(),
+                                                                          on_token=on_token))
+            viz_future = None
+            if viz:
+                viz_future = executor.submit(lambda: render_visualizations(df, missing_counts(), column_kinds()))
             
-            stats_output = format_section("Correlation Analysis", correlations.to_string())
-            stats_output += format_section("\nStatistical Tests", stat_tests)
-            stats_output += format_section("\nOutlier Detection", 
-                                         "\n".join(f"{k}: {len(v)} outliers" for k, v in outliers.items()))
+            if viz:
+                report.add('viz', lambda: "\n[magenta]Visualizations opened in your browser.[/]")
             
-            output.append(stats_output)
-        
-        llm_output = None
-        if llm:
-            llm_section = format_section(f"LLM Analysis (using prompt: '{prompt_type or 'default'}')", "")
-            output.append(llm_section)
-            data_type = prompt_type or detect_data_type(df)
-            llm_output = get_llm_analysis(df, model, prompt_type=data_type)
+            if advanced_stats:
+                # Add statistical analysis sections
+                def statistics():
+                    correlations = calculate_correlations(df)
+                    stat_tests = perform_statistical_tests(df)
+                    outliers = detect_outliers(df)
+                    
+                    return "".join([
+                        format_section("Correlation Analysis", correlations.to_string()),
+                        format_section("\nStatistical Tests", stat_tests),
+                        format_section("\nOutlier Detection",
+                                       "\n".join(f"{k}: {len(v)} outliers" for k, v in outliers.items()))
+                    ])
+                report.add('advanced_stats', statistics)
+            
+            if llm:
+                llm_section = format_section(f"LLM Analysis (using prompt: '{prompt_type or 'default'}')", "")
+                report.add('llm', lambda: llm_section)
+            
+            if viz_future:
+                viz_future.result()
+            llm_output = llm_future.result() if llm_future else None
         
-        return "\n".join(output), llm_output
+        return report, llm_output
         
     except Exception as e:
         return f"[bold red]Error analyzing file: {str(e)}[/]", ""
 
+def _analyze_sheet(source, sheet_index, **kwargs) -> Tuple[str, str]:
+    """Analyze one sheet and render its report so the result can be sent back from a worker process."""
+    result, llm_output = analyze_data(source, sheet_index, **kwargs)
+    return str(result), llm_output
 
+def analyze_all_sheets(source, **kwargs) -> List[Tuple[str, str, str]]:
+    """
+    Analyze every sheet of an Excel file or Google Sheet in parallel worker processes.
+    
+    Args:
+        source (str): Path to the Excel file or Google Sheets ID.
+        **kwargs: Analysis options passed on to analyze_data.
+    
+    Returns:
+        List[Tuple[str, str, str]]: The sheet name, analysis result and LLM output per sheet.
+    """
+    if source.startswith('gs://'):
+        spreadsheet = GoogleSheetsReader().open_spreadsheet(source)
+        sheet_names = [title for _, title in get_sheets_list(spreadsheet)]
+    else:
+        sheet_names = pd.ExcelFile(source, engine=EXCEL_ENGINE).sheet_names
+    
+    # Each worker reads and analyzes only its own sheet; LLM prompts come back to be
+    # generated together, so the Ollama server can batch them
+    max_workers = min(len(sheet_names), os.cpu_count() or 1) or 1
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(partial(_analyze_sheet, source, defer_llm=True, **kwargs),
+                                    range(len(sheet_names))))
+    
+    reports = [result for result, _ in results]
+    prompts = [prompt for _, prompt in results]
+    if kwargs.get('llm'):
+        # Sheets that failed to load have no prompt
+        requested = [i for i, prompt in enumerate(prompts) if prompt]
+        outputs = generate_batch([prompts[i] for i in requested], kwargs.get('model', 'llama3.2'))
+        llm_outputs = [""] * len(prompts)
+        for i, output in zip(requested, outputs):
+            llm_outputs[i] = output
+    else:
+        llm_outputs = prompts
+    return list(zip(sheet_names, reports, llm_outputs))
@@ -3,8 +3,10 @@ from .google_sheets_reader import GoogleSheetsReader
 from .xlsx_reader import XLSXReader
 from .parquet_reader import ParquetReader
 from .json_reader import JSONReader  # Add this import
+import pandas as pd
+from typing import Optional
 
-def get_data_reader(source: str):
+def get_data_reader(source: str, workbook: Optional[pd.ExcelFile] = None):
     if source.startswith('gs://'):
         return GoogleSheetsReader()
     elif source.endswith('.csv'):
@@ -12,7 +14,7 @@ def get_data_reader(source: str):
     elif source.endswith('.tsv'):
         return CSVReader(delimiter='\t')
     elif source.endswith('.xlsx'):
-        return XLSXReader()
+        return XLSXReader(workbook=workbook)
     elif source.endswith('.parquet'):
         return ParquetReader()
     elif source.endswith('.json'):
@@ -1,5 +1,27 @@
+from typing import Iterator
 import pandas as pd
+import pyarrow as pa
 
 class BaseReader:
+    # Whether iter_chunks reads the source incrementally rather than loading it whole
+    supports_streaming = False
+
     def read_data(self, source: str, sheet_index: int = 0) -> pd.DataFrame:
         raise NotImplementedError("Subclasses should implement this method")
+
+    def iter_chunks(self, source: str, sheet_index: int = 0) -> Iterator[pd.DataFrame]:
+        """Yield the data in chunks; readers without a streaming path yield it whole."""
+        yield self.read_data(source, sheet_index)
+
+    def _to_pandas(self, table: pa.Table) -> pd.DataFrame:
+        """Convert an Arrow table to a frame backed by Arrow dtypes."""
+        # Entirely empty columns come back as Arrow's null type; treat them as float like pandas does
+        schema = pa.schema([
+            field.with_type(pa.float64()) if pa.types.is_null(field.type) else field
+            for field in table.schema
+        ])
+        # Dictionary columns keep pandas' default conversion to Categorical
+        return table.cast(schema).to_pandas(types_mapper=_arrow_dtype)
+
+def _arrow_dtype(arrow_type: pa.DataType):
+    return None if pa.types.is_dictionary(arrow_type) else pd.ArrowDtype(arrow_type)
@@ -1,9 +1,78 @@
+from typing import Iterator
 import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pacsv
 from .base_reader import BaseReader
 
+# Bytes parsed per chunk when streaming large files
+CHUNK_BYTES = 64 << 20
+
+# String columns with at most this many distinct values (per block) are read as categories
+MAX_CATEGORY_CARDINALITY = 50
+
 class CSVReader(BaseReader):
+    supports_streaming = True
+
     def __init__(self, delimiter=','):
         self.delimiter = delimiter
 
     def read_data(self, source: str, sheet_index: int = 0) -> pd.DataFrame:
-        return pd.read_csv(source, delimiter=self.delimiter)
+        # Arrow's reader tokenizes blocks in parallel and builds columnar buffers directly
+        table = pacsv.read_csv(
+            source,
+            read_options=pacsv.ReadOptions(use_threads=True),
+            parse_options=self._parse_options(),
+            convert_options=self._convert_options()
+        )
+        return self._to_pandas(table)
+
+    def iter_chunks(self, source: str, sheet_index: int = 0) -> Iterator[pd.DataFrame]:
+        read_options = pacsv.ReadOptions(use_threads=True, block_size=CHUNK_BYTES)
+        # Arrow infers column types from the first block and fails on later blocks that
+        # disagree, so the inferred types are only taken as targets: every column is
+        # parsed as text and converted block by block
+        schema = pacsv.open_csv(
+            source,
+            read_options=read_options,
+            parse_options=self._parse_options(),
+            convert_options=pacsv.ConvertOptions(strings_can_be_null=True)
+        ).schema
+        reader = pacsv.open_csv(
+            source,
+            read_options=read_options,
+            parse_options=self._parse_options(),
+            convert_options=pacsv.ConvertOptions(
+                strings_can_be_null=True,
+                column_types={name: pa.string() for name in schema.names}
+            )
+        )
+        for batch in reader:
+            columns = [self._conform(column, field.type) for column, field in zip(batch.columns, schema)]
+            yield self._to_pandas(pa.Table.from_arrays(columns, names=schema.names))
+
+    @staticmethod
+    def _conform(column: pa.Array, arrow_type: pa.DataType) -> pa.Array:
+        """Convert a text column to the type inferred from the first block, tolerating drift."""
+        if pa.types.is_null(arrow_type):
+            # Empty in the first block: kept as text whatever later blocks hold
+            return column
+        try:
+            return column.cast(arrow_type)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            if pa.types.is_integer(arrow_type) or pa.types.is_floating(arrow_type):
+                # Numeric columns stay numeric in every chunk (e.g. ints that later hold
+                # 1.5 become floats); values that don't parse as numbers become missing
+                return pa.array(pd.to_numeric(column.to_pandas(), errors='coerce'), type=pa.float64())
+            return column
+
+    def _parse_options(self) -> pacsv.ParseOptions:
+        return pacsv.ParseOptions(delimiter=self.delimiter)
+
+    def _convert_options(self) -> pacsv.ConvertOptions:
+        # Low-cardinality strings are dictionary-encoded while parsing, which stores each
+        # distinct value once instead of once per row
+        return pacsv.ConvertOptions(
+            strings_can_be_null=True,
+            auto_dict_encode=True,
+            auto_dict_max_cardinality=MAX_CATEGORY_CARDINALITY
+        )
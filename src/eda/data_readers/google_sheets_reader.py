@@ -1,66 +1,109 @@
-import gspread
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-import pickle
+import json
 from pathlib import Path
+from typing import TYPE_CHECKING
 import pandas as pd
 from .base_reader import BaseReader
 
+# gspread and google-auth are imported where they are used so that loading the
+# readers package (and CLI startup) doesn't pay for them unless Sheets are read
+if TYPE_CHECKING:
+    import gspread
+    from google.oauth2.credentials import Credentials
+
 SCOPES = ['https://www.googleapis.com/auth/spreadsheets.readonly']
-TOKEN_PATH = Path.home() / '.eda' / 'token.pickle'
+TOKEN_PATH = Path.home() / '.eda' / 'token.json'
+# Token cache written by older versions; migrated to JSON on first use
+LEGACY_TOKEN_PATH = Path.home() / '.eda' / 'token.pickle'
 CREDENTIALS_DIR = Path.home() / '.eda'
 
+# Credentials loaded earlier in this process, reused while they remain valid
+_CACHED_CREDS = None
+
 class GoogleSheetsReader(BaseReader):
-    def get_google_credentials(self) -> Credentials:
+    def get_google_credentials(self) -> 'Credentials':
+        global _CACHED_CREDS
+        if _CACHED_CREDS is not None and _CACHED_CREDS.valid:
+            return _CACHED_CREDS
+        
+        from google.oauth2.credentials import Credentials
+        from google_auth_oauthlib.flow import InstalledAppFlow
+        from google.auth.exceptions import RefreshError
+        from google.auth.transport.requests import Request
+        
         creds = None
+        migrated = False
         CREDENTIALS_DIR.mkdir(parents=True, exist_ok=True)
         if TOKEN_PATH.exists():
-            with open(TOKEN_PATH, 'rb') as token:
+            creds = Credentials.from_authorized_user_info(json.loads(TOKEN_PATH.read_text()), SCOPES)
+        elif LEGACY_TOKEN_PATH.exists():
+            import pickle
+            
+            with open(LEGACY_TOKEN_PATH, 'rb') as token:
                 creds = pickle.load(token)
+            migrated = True
         if not creds or not creds.valid:
             if creds and creds.expired and creds.refresh_token:
-                creds.refresh(Request())
-            else:
+                try:
+                    creds.refresh(Request())
+                except RefreshError:
+                    # Revoked or expired refresh token; authorize again below
+                    creds = None
+            if not creds or not creds.valid:
                 flow = InstalledAppFlow.from_client_secrets_file(
                     str(CREDENTIALS_DIR / 'client_secrets.json'),
                     SCOPES
                 )
                 creds = flow.run_local_server(port=0)
-            with open(TOKEN_PATH, 'wb') as token:
-                pickle.dump(creds, token)
+            TOKEN_PATH.write_text(creds.to_json())
+        elif migrated:
+            TOKEN_PATH.write_text(creds.to_json())
+        if migrated:
+            LEGACY_TOKEN_PATH.unlink()
+        _CACHED_CREDS = creds
         return creds
 
-    def read_data(self, source: str, sheet_index: int = 0) -> pd.DataFrame:
+    def open_spreadsheet(self, source: str) -> 'gspread.Spreadsheet':
+        """Open the spreadsheet for a 'gs://<id>' source with the cached credentials."""
+        import gspread
+        
         sheet_id = source.replace('gs://', '')
-        credentials = self.get_google_credentials()
-        gc = gspread.authorize(credentials)
-        spreadsheet = gc.open_by_key(sheet_id)
+        return gspread.authorize(self.get_google_credentials()).open_by_key(sheet_id)
+
+    def read_data(self, source: str, sheet_index: int = 0) -> pd.DataFrame:
+        spreadsheet = self.open_spreadsheet(source)
         worksheet = spreadsheet.worksheets()[sheet_index]
         return self.get_sheet_as_df(worksheet)
 
     def get_sheet_as_df(self, worksheet):
-        data = worksheet.get_all_values()
+        from gspread.utils import DateTimeOption, ValueRenderOption
+        
+        # Unformatted values arrive as JSON numbers rather than display strings (no
+        # thousands separators, currency or percent signs); dates stay readable strings
+        data = worksheet.get_all_values(
+            value_render_option=ValueRenderOption.unformatted,
+            date_time_render_option=DateTimeOption.formatted_string
+        )
         if not data:
             return pd.DataFrame()
-        headers = data[0]
+        headers = [str(header) for header in data[0]]
         rows = data[1:]
-        converted_rows = [[self.infer_type(value) for value in row] for row in rows]
-        df = pd.DataFrame(converted_rows, columns=headers)
-        object_columns = df.select_dtypes(include=['object']).columns
-        df[object_columns] = df[object_columns].astype('string')
+        df = pd.DataFrame(rows, columns=headers, dtype=object)
+        df = df.where(df.ne(''))
+        for i in range(df.shape[1]):
+            df.isetitem(i, self.infer_column_type(df.iloc[:, i]))
         return df
 
-    def infer_type(self, value):
-        if value == '':
-            return None
-        try:
-            return int(value)
-        except ValueError:
-            try:
-                return float(value)
-            except ValueError:
-                try:
-                    return pd.to_datetime(value)
-                except (ValueError, TypeError):
-                    return str(value)
+    def infer_column_type(self, column: pd.Series) -> pd.Series:
+        """Convert a column to numeric or datetime when all its non-empty values parse, else to strings."""
+        non_empty = column.notna().sum()
+        if non_empty == 0:
+            return column.astype('string')
+        numeric = pd.to_numeric(column, errors='coerce')
+        if numeric.notna().sum() == non_empty:
+            return numeric
+        # Dates come back as formatted strings; numbers mixed in would parse as epoch offsets
+        if column.dropna().map(type).eq(str).all():
+            dates = pd.to_datetime(column, errors='coerce', format='mixed')
+            if dates.notna().sum() == non_empty:
+                return dates
+        return column.astype('string')
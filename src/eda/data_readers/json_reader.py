@@ -1,7 +1,18 @@
 import pandas as pd
+import pyarrow as pa
+from pyarrow import json as pajson
 from .base_reader import BaseReader
 
+# Bytes parsed per block; blocks are parsed in parallel
+BLOCK_BYTES = 8 << 20
+
 class JSONReader(BaseReader):
     def read_data(self, source: str, sheet_index: int = 0) -> pd.DataFrame:
-        with open(source, 'r') as file:
-            return pd.read_json(file, lines=True)
+        # Arrow's newline-delimited JSON reader parses blocks on multiple threads
+        try:
+            table = pajson.read_json(source, read_options=pajson.ReadOptions(use_threads=True, block_size=BLOCK_BYTES))
+        except pa.ArrowInvalid:
+            # Records Arrow can't unify into one schema (e.g. a field changing type)
+            with open(source, 'r') as file:
+                return pd.read_json(file, lines=True)
+        return self._to_pandas(table)
@@ -1,6 +1,10 @@
+from typing import List, Optional
 import pandas as pd
+from pyarrow import parquet as pq
 from .base_reader import BaseReader
 
 class ParquetReader(BaseReader):
-    def read_data(self, source: str, sheet_index: int = 0) -> pd.DataFrame:
-        return pd.read_parquet(source)
+    def read_data(self, source: str, sheet_index: int = 0, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        # Only the requested columns are read and decompressed, across multiple threads
+        table = pq.read_table(source, columns=columns, use_threads=True)
+        return self._to_pandas(table)
@@ -1,6 +1,20 @@
+from typing import Optional
 import pandas as pd
 from .base_reader import BaseReader
 
+# Prefer the Rust-based calamine parser when it is installed
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = 'calamine'
+except ImportError:
+    EXCEL_ENGINE = 'openpyxl'
+
 class XLSXReader(BaseReader):
+    def __init__(self, workbook: Optional[pd.ExcelFile] = None):
+        # An already opened workbook (e.g. from sheet selection) avoids parsing the file twice
+        self.workbook = workbook
+
     def read_data(self, source: str, sheet_index: int = 0) -> pd.DataFrame:
-        return pd.read_excel(source, sheet_name=sheet_index)
+        if self.workbook is not None:
+            return pd.read_excel(self.workbook, sheet_name=sheet_index, dtype_backend='pyarrow')
+        return pd.read_excel(source, sheet_name=sheet_index, engine=EXCEL_ENGINE, dtype_backend='pyarrow')
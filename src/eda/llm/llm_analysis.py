@@ -1,22 +1,63 @@
+import os
+import numpy as np
 import pandas as pd
-import ollama
-from rich.console import Console
+from eda._console import console
+from eda.analysis.column_types import classify_columns
+from eda.llm.scheduler import length_order
 from pathlib import Path
+from functools import lru_cache
+from string import Formatter
+from typing import TYPE_CHECKING, Callable, List, Optional, Tuple
 import yaml
 
-console = Console()
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _Loader
 
-def load_prompt_template(prompt_type: str = 'default') -> str:
-    prompt_path = Path(__file__).parent.parent / 'prompts' / f'{prompt_type}.yaml'
+if TYPE_CHECKING:
+    import ollama
+
+PROMPT_DIR = Path(__file__).resolve().parent.parent / 'prompts'
+
+# Ollama's default number of requests served in parallel per model
+DEFAULT_NUM_PARALLEL = 4
+
+# Summary statistics sent to the LLM cover at most this many columns, with string
+# values cut to this many characters
+MAX_DESCRIBE_COLS = 50
+MAX_CELL_CHARS = 40
+
+class PromptTemplate(str):
+    """Prompt template text that is split into its placeholders once, when it is loaded."""
+    
+    def __new__(cls, text: str) -> 'PromptTemplate':
+        template = super().__new__(cls, text)
+        # (literal text, field name, conversion, format spec) per placeholder
+        template.parts = [(literal, field, conversion, spec or '')
+                          for literal, field, spec, conversion in Formatter().parse(text)]
+        return template
+    
+    def render(self, **values) -> str:
+        """Fill in the placeholders like str.format, without re-parsing them."""
+        formatter = Formatter()
+        return "".join(
+            literal + (format(formatter.convert_field(values[field], conversion), spec) if field is not None else '')
+            for literal, field, conversion, spec in self.parts
+        )
+
+@lru_cache(maxsize=8)
+def load_prompt_template(prompt_type: str = 'default') -> PromptTemplate:
+    prompt_path = PROMPT_DIR / f'{prompt_type}.yaml'
     if not prompt_path.exists():
-        prompt_path = Path(__file__).parent.parent / 'prompts' / 'default.yaml'
+        prompt_path = PROMPT_DIR / 'default.yaml'
     with open(prompt_path) as f:
-        prompt_data = yaml.safe_load(f)
-    return prompt_data['template']
+        prompt_data = yaml.load(f, Loader=_Loader)
+    return PromptTemplate(prompt_data['template'])
 
-def detect_data_type(df: pd.DataFrame) -> str:
-    numeric_cols = df.select_dtypes(include=['int64', 'float64']).columns
-    cat_cols = df.select_dtypes(include=['object', 'string', 'category']).columns
+def detect_data_type(df: pd.DataFrame, columns: Optional[Tuple[pd.Index, pd.Index]] = None) -> str:
+    # Callers that already classified the columns pass (numeric, categorical) in
+    numeric_cols, cat_cols = columns if columns is not None else classify_columns(df)
     if 'date' in df.columns or 'timestamp' in df.columns:
         return 'timeseries'
     elif len(numeric_cols) > len(cat_cols) * 2:
@@ -25,23 +66,123 @@ def detect_data_type(df: pd.DataFrame) -> str:
         return 'categorical'
     return 'default'
 
-def get_llm_analysis(df: pd.DataFrame, model: str, prompt_type: str) -> str:
-    prompt_template = load_prompt_template(prompt_type)
-    stats_summary = df.describe(include='all').to_string()
-    context = prompt_template.format(
+def summary_for_prompt(summary: pd.DataFrame, max_cols: int = MAX_DESCRIBE_COLS) -> str:
+    """Render summary statistics compactly for a prompt, since prompt length drives prefill time."""
+    def compact(value):
+        if isinstance(value, (float, np.floating)):
+            return round(float(value), 3)
+        if isinstance(value, str) and len(value) > MAX_CELL_CHARS:
+            return value[:MAX_CELL_CHARS] + '...'
+        return value
+    
+    text = summary.iloc[:, :max_cols].map(compact).to_string()
+    if summary.shape[1] > max_cols:
+        text += f"\n({summary.shape[1] - max_cols} more columns not shown)"
+    return text
+
+def is_trivial(df: pd.DataFrame) -> bool:
+    """Whether a frame has no rows or no columns, leaving nothing for the LLM to analyze."""
+    return df.shape[0] == 0 or df.shape[1] == 0
+
+@lru_cache(maxsize=None)
+def _get_client() -> 'ollama.Client':
+    """Shared Ollama client, so its HTTP connection is kept alive across requests."""
+    import ollama
+    
+    return ollama.Client()
+
+def build_llm_prompt(df: pd.DataFrame, prompt_type: str, stats_summary: Optional[pd.DataFrame] = None,
+                     dtypes_str: Optional[str] = None, max_describe_cols: int = MAX_DESCRIBE_COLS) -> str:
+    # Callers that already computed the summary or dtypes pass them in to avoid another pass over the data
+    if stats_summary is None:
+        stats_summary = df.iloc[:, :max_describe_cols].describe(include='all')
+    if dtypes_str is None:
+        dtypes_str = df.dtypes.to_string()
+    return load_prompt_template(prompt_type).render(
         rows=df.shape[0],
         columns=df.shape[1],
-        dtypes=df.dtypes.to_string(),
-        stats=stats_summary
+        dtypes=dtypes_str,
+        stats=summary_for_prompt(stats_summary, max_describe_cols)
     )
+
+def get_llm_analysis(df: pd.DataFrame, model: str, prompt_type: str, stats_summary: Optional[pd.DataFrame] = None,
+                     dtypes_str: Optional[str] = None, on_token: Optional[Callable[[str], None]] = None) -> str:
+    if is_trivial(df):
+        return ""
+    context = build_llm_prompt(df, prompt_type, stats_summary, dtypes_str)
     try:
-        response = ollama.generate(
+        # Stream the response so callers can show it while it is being generated
+        response = _get_client().generate(
             model=model,
             prompt=context,
-            stream=False
+            stream=True
         )
-        markdown_text = response['response']
-        return markdown_text
+        chunks = []
+        for chunk in response:
+            chunks.append(chunk['response'])
+            if on_token:
+                on_token(chunk['response'])
+        return "".join(chunks)
     except Exception as e:
         console.print(f"[bold red]Error getting LLM analysis: {str(e)}[/]")
         return ""
+
+def get_llm_analysis_batch(dfs: List[pd.DataFrame], model: str, prompt_type: Optional[str] = None) -> List[str]:
+    """Analyze several DataFrames with concurrent requests the Ollama server can batch together."""
+    # Empty frames get an empty analysis without a request
+    requested = [i for i, df in enumerate(dfs) if not is_trivial(df)]
+    prompts = [build_llm_prompt(dfs[i], prompt_type or detect_data_type(dfs[i])) for i in requested]
+    outputs = [""] * len(dfs)
+    for i, output in zip(requested, generate_batch(prompts, model)):
+        outputs[i] = output
+    return outputs
+
+def generate_batch(prompts: List[str], model: str, max_concurrency: Optional[int] = None) -> List[str]:
+    """
+    Generate responses for several prompts at once.
+    
+    Requests are sent concurrently, shortest prompt first, so the server can decode them
+    in one batch; concurrency defaults to the server's OLLAMA_NUM_PARALLEL setting.
+    Failed prompts yield "".
+    """
+    import asyncio
+    
+    if not prompts:
+        return []
+    if max_concurrency is None:
+        max_concurrency = int(os.environ.get('OLLAMA_NUM_PARALLEL', DEFAULT_NUM_PARALLEL))
+    
+    async def run() -> List[str]:
+        import ollama
+        
+        # One client shared by the whole batch; its connections belong to this event loop
+        client = ollama.AsyncClient()
+        slots = asyncio.Semaphore(max_concurrency)
+        
+        async def generate(prompt: str) -> str:
+            async with slots:
+                response = await client.generate(model=model, prompt=prompt, stream=False)
+            return response['response']
+        
+        # All requests are queued at once; the semaphore admits them shortest prompt first
+        # and starts the next one as soon as any slot frees up
+        order = length_order(prompts)
+        outputs = await asyncio.gather(*(generate(prompts[i]) for i in order), return_exceptions=True)
+        results = [None] * len(prompts)
+        for i, output in zip(order, outputs):
+            results[i] = output
+        return results
+    
+    try:
+        results = asyncio.run(run())
+    except Exception as e:
+        console.print(f"[bold red]Error getting LLM analysis: {str(e)}[/]")
+        return [""] * len(prompts)
+    
+    outputs = []
+    for result in results:
+        if isinstance(result, Exception):
+            console.print(f"[bold red]Error getting LLM analysis: {str(result)}[/]")
+            result = ""
+        outputs.append(result)
+    return outputs
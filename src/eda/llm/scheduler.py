@@ -0,0 +1,11 @@
+from typing import List, Sequence
+import numpy as np
+
+def length_order(prompts: Sequence[str]) -> List[int]:
+    """
+    Order prompt indices from shortest to longest prompt.
+    
+    Requests are admitted to the server in this order, so short prompts aren't queued
+    behind very long ones; ties keep their original order.
+    """
+    return np.argsort([len(prompt) for prompt in prompts], kind='stable').tolist()
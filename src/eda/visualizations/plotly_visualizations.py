@@ -1,60 +1,103 @@
+from typing import TYPE_CHECKING, Optional, Tuple
+import numpy as np
 import pandas as pd
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+from eda.analysis.column_types import classify_columns
+from eda.analysis.statistical_analysis import calculate_correlations
 
-def create_visualizations(df: pd.DataFrame) -> go.Figure:
-    """Create a dashboard of visualizations for the dataset."""
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+# Only the most frequent categories of each column are plotted
+MAX_CATEGORIES = 20
+
+# Larger frames are sampled down to this many rows for the heatmap, box and scatter plots
+MAX_PLOT_ROWS = 50_000
+
+def _float32(column: pd.Series) -> np.ndarray:
+    """Single-precision values for plotting; halves the data serialized into the HTML."""
+    return column.to_numpy(dtype=np.float32, na_value=np.nan)
+
+def create_visualizations(df: pd.DataFrame, missing: Optional[pd.Series] = None,
+                          columns: Optional[Tuple[pd.Index, pd.Index]] = None) -> 'go.Figure':
+    """
+    Create a dashboard of visualizations for the dataset.
+    
+    Missing-value counts and the (numeric, categorical) column split can be passed in
+    when the caller has already computed them.
+    """
+    # plotly pulls in hundreds of modules, so only import it when a dashboard is built
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+    
     # Calculate number of numeric and categorical columns
-    numeric_cols = df.select_dtypes(include=['int64', 'float64']).columns
-    cat_cols = df.select_dtypes(include=['object', 'string', 'category']).columns
+    numeric_cols, cat_cols = columns if columns is not None else classify_columns(df)
+    
+    # Plot a fixed-size sample of large frames (kept in row order for the time series);
+    # missing values and category counts still cover every row
+    plot_df = df
+    if len(df) > MAX_PLOT_ROWS:
+        rows = np.sort(np.random.default_rng(0).choice(len(df), MAX_PLOT_ROWS, replace=False))
+        plot_df = df.iloc[rows]
     
     # Create subplot grid based on number of columns
     n_cat = len(cat_cols)
     
+    if missing is None:
+        missing = df.isnull().sum()
+    has_missing = bool(missing.any())
+    
     fig = make_subplots(
         rows=2 + (n_cat > 0),  # Add row if we have categorical columns
         cols=2,
         subplot_titles=(
             "Correlation Heatmap", "Distribution Overview",
-            "Missing Values", "Time Series" if 'date' in df.columns else "Scatter Matrix",
+            "Missing Values" if has_missing else "Missing Values (none)", "Time Series" if 'date' in df.columns else "Scatter Matrix",
             "Category Distributions" if n_cat > 0 else None
         )
     )
     
     # 1. Correlation heatmap for numeric columns
     if len(numeric_cols) > 1:
-        corr = df[numeric_cols].corr()
+        # Single precision is plenty for a heatmap and halves the memory moved
+        corr = calculate_correlations(plot_df[numeric_cols].astype(np.float32))
         fig.add_trace(
-            go.Heatmap(z=corr, x=corr.columns, y=corr.columns),
+            go.Heatmap(z=corr.to_numpy(), x=list(numeric_cols), y=list(numeric_cols)),
             row=1, col=1
         )
     
-    # 2. Distribution overview (box plots)
-    for i, col in enumerate(numeric_cols):
+    # 2. Distribution overview (box plots), as a single trace over all numeric columns.
+    # Boxes are positioned by column number and labelled through the axis ticks, so
+    # column names aren't repeated for every value in the serialized figure.
+    if len(numeric_cols):
+        values = plot_df[numeric_cols].to_numpy(dtype=np.float32, na_value=np.nan)
+        codes = np.arange(len(numeric_cols), dtype=np.min_scalar_type(len(numeric_cols)))
+        positions = np.repeat(codes, len(plot_df))
         fig.add_trace(
-            go.Box(y=df[col], name=col),
+            go.Box(x=positions, y=values.ravel(order='F'), name="Distributions"),
             row=1, col=2
         )
+        fig.update_xaxes(tickvals=list(range(len(numeric_cols))), ticktext=list(numeric_cols), row=1, col=2)
     
-    # 3. Missing values visualization
-    missing = df.isnull().sum()
-    fig.add_trace(
-        go.Bar(x=missing.index, y=missing.values, name="Missing Values"),
-        row=2, col=1
-    )
+    # 3. Missing values visualization, skipped when there is nothing to show
+    if has_missing:
+        fig.add_trace(
+            go.Bar(x=missing.index, y=missing.values, name="Missing Values"),
+            row=2, col=1
+        )
     
     # 4. Time series or scatter plot
     if 'date' in df.columns:
-        for col in numeric_cols[:3]:  # Limit to first 3 numeric columns
-            fig.add_trace(
-                go.Scatter(x=df['date'], y=df[col], name=col),
-                row=2, col=2
-            )
+        series_cols = numeric_cols[:3]  # Limit to first 3 numeric columns
+        # Added in one call so the figure is validated once rather than per trace
+        fig.add_traces(
+            [go.Scatter(x=plot_df['date'], y=_float32(plot_df[col]), name=col) for col in series_cols],
+            rows=2, cols=2
+        )
     elif len(numeric_cols) >= 2:
         fig.add_trace(
             go.Scatter(
-                x=df[numeric_cols[0]], 
-                y=df[numeric_cols[1]], 
+                x=_float32(plot_df[numeric_cols[0]]), 
+                y=_float32(plot_df[numeric_cols[1]]), 
                 mode='markers'
             ),
             row=2, col=2
@@ -62,12 +105,13 @@ def create_visualizations(df: pd.DataFrame) -> go.Figure:
     
     # 5. Category distributions (if categorical columns exist)
     if n_cat > 0:
-        for i, col in enumerate(cat_cols[:3]):  # Limit to first 3 categorical columns
-            value_counts = df[col].value_counts()
-            fig.add_trace(
-                go.Bar(x=value_counts.index, y=value_counts.values, name=col),
-                row=3, col=1 + (i > 1)
-            )
+        bar_cols = cat_cols[:3]  # Limit to first 3 categorical columns
+        bars = []
+        for col in bar_cols:
+            # Partial selection of the top categories instead of sorting every distinct value
+            value_counts = df[col].value_counts(sort=False).nlargest(MAX_CATEGORIES)
+            bars.append(go.Bar(x=value_counts.index, y=value_counts.values, name=col))
+        fig.add_traces(bars, rows=3, cols=[1 + (i > 1) for i in range(len(bars))])
     
     # Update layout
     fig.update_layout(
@@ -1,17 +1,14 @@
 import pytest
-from eda.core import (
-    analyze_data, 
-    read_data, 
-    format_markdown, 
+from eda.core import analyze_data
+from eda.llm.llm_analysis import (
     detect_data_type,
     load_prompt_template,
-    get_llm_analysis
+    get_llm_analysis,
+    get_llm_analysis_batch
 )
 import pandas as pd
 import os
-from unittest.mock import patch, MagicMock
-from google.oauth2.credentials import Credentials
-import click
+from unittest.mock import patch, MagicMock, AsyncMock
 
 def test_analyze_data_local(tmp_path):
     # Create a test CSV file
@@ -23,32 +20,40 @@ def test_analyze_data_local(tmp_path):
     df.to_csv(test_file, index=False)
     
     # Test the analyze function
-    result = analyze_data(str(test_file))
-    assert "Shape:" in result
-    assert "A" in result
-    assert "B" in result
+    result, _ = analyze_data(str(test_file))
+    assert "Shape:" in str(result)
+    assert "A" in str(result)
+    assert "B" in str(result)
 
 def test_analyze_data_with_llm(tmp_path):
     df = pd.DataFrame({'A': [1, 2, 3]})
     test_file = tmp_path / "test.csv"
     df.to_csv(test_file, index=False)
     
-    with patch('ollama.generate') as mock_generate:
-        mock_generate.return_value = {'response': '# Test\nAnalysis content'}
-        result = analyze_data(str(test_file), llm=True)
-        assert "Test" in result
-        assert "Analysis content" in result
+    # Patch the shared client so no request reaches an Ollama server
+    client = MagicMock()
+    client.generate.return_value = iter([{'response': '# Test\n'}, {'response': 'Analysis content'}])
+    with patch('eda.llm.llm_analysis._get_client', return_value=client):
+        result, llm_output = analyze_data(str(test_file), llm=True)
+    assert "LLM Analysis" in str(result)
+    assert llm_output == "# Test\nAnalysis content"
+    assert client.generate.call_args.kwargs['stream'] is True
 
-def test_format_markdown():
-    markdown = """# Header
-**bold text**
-*italic text*
-`code`
-- bullet point"""
-    
-    result = format_markdown(markdown)
-    assert click.style("Header", fg='bright_cyan', bold=True) in result
-    assert "•" in result  # Check bullet point conversion
+def test_get_llm_analysis_batch():
+    dfs = [pd.DataFrame({'A': [1, 2, 3]}), pd.DataFrame(), pd.DataFrame({'B': ['x', 'y']})]
+    
+    async def generate(model, prompt, stream):
+        return {'response': f"{model}: {prompt.count('rows')}"}
+    
+    with patch('ollama.AsyncClient') as mock_client:
+        mock_client.return_value.generate = AsyncMock(side_effect=generate)
+        outputs = get_llm_analysis_batch(dfs, 'llama3.2')
+    
+    # One request per non-empty frame, answers returned in input order
+    assert mock_client.return_value.generate.await_count == 2
+    assert outputs[0].startswith('llama3.2')
+    assert outputs[1] == ""
+    assert outputs[2].startswith('llama3.2')
 
 def test_detect_data_type():
     # Test numeric data
@@ -81,12 +86,102 @@ def test_load_prompt_template():
     template = load_prompt_template('nonexistent')
     assert '{rows}' in template
 
+def test_prompt_template_renders_like_str_format():
+    from eda.llm.llm_analysis import PromptTemplate
+    text = "Rows: {rows:>5}, stats: {stats!r} {{literal}}"
+    assert PromptTemplate(text).render(rows=12, stats='a\nb') == text.format(rows=12, stats='a\nb')
+
+def test_load_prompt_template_cache_clear_reaches_prompts(tmp_path, monkeypatch):
+    from eda.llm import llm_analysis
+    from eda.llm.llm_analysis import build_llm_prompt
+    monkeypatch.setattr(llm_analysis, 'PROMPT_DIR', tmp_path)
+    df = pd.DataFrame({'A': [1, 2, 3]})
+    prompt_file = tmp_path / 'default.yaml'
+    
+    load_prompt_template.cache_clear()
+    try:
+        prompt_file.write_text("template: 'First {rows}'\n")
+        assert build_llm_prompt(df, 'default') == 'First 3'
+        prompt_file.write_text("template: 'Second {rows}'\n")
+        load_prompt_template.cache_clear()
+        assert build_llm_prompt(df, 'default') == 'Second 3'
+    finally:
+        load_prompt_template.cache_clear()
+
 @patch('webbrowser.open')
 def test_analyze_data_with_viz(mock_browser, tmp_path):
     df = pd.DataFrame({'A': [1, 2, 3]})
     test_file = tmp_path / "test.csv"
     df.to_csv(test_file, index=False)
     
-    result = analyze_data(str(test_file), viz=True)
-    assert "Visualizations opened in your browser" in result
+    result, _ = analyze_data(str(test_file), viz=True)
+    assert "Visualizations opened in your browser" in str(result)
     mock_browser.assert_called_once()
+
+def test_analyze_data_arrow_dtypes_are_not_markup(tmp_path):
+    from rich.console import Console
+    df = pd.DataFrame({'t': pd.to_datetime(['2024-01-01', '2024-01-02']), 'a[/b]': [1.5, 2.5]})
+    test_file = tmp_path / "test.parquet"
+    df.to_parquet(test_file)
+    
+    result, _ = analyze_data(str(test_file))
+    console = Console(record=True, width=200)
+    console.print(result)
+    text = console.export_text()
+    assert "timestamp[ns][pyarrow]" in text
+    assert "a[/b]: 0" in text
+
+@pytest.mark.parametrize('llm', [False, True])
+def test_analyze_data_large_file(tmp_path, monkeypatch, llm):
+    from eda import core
+    df = pd.DataFrame({'A': [1.0, 2.0, None, 4.0], 'B': ['x', 'y', 'x', None]})
+    test_file = tmp_path / "test.csv"
+    df.to_csv(test_file, index=False)
+    # Treat every file as large so the streaming path is taken
+    monkeypatch.setattr(core, 'LARGE_FILE_BYTES', 0)
+    
+    client = MagicMock()
+    client.generate.return_value = iter([{'response': 'Analysis content'}])
+    with patch('eda.llm.llm_analysis._get_client', return_value=client):
+        result, llm_output = analyze_data(str(test_file), llm=llm)
+    rendered = str(result)
+    assert "Large file" in rendered
+    assert "Error" not in rendered
+    assert "mean" in rendered
+    if llm:
+        assert llm_output == "Analysis content"
+        assert "mean" in client.generate.call_args.kwargs['prompt']
+
+def test_analyze_data_large_file_without_streaming_reader(tmp_path, monkeypatch):
+    from eda import core
+    test_file = tmp_path / "test.json"
+    test_file.write_text('{"A": 1.0}\n{"A": 2.0}\n{"A": 4.0}\n')
+    monkeypatch.setattr(core, 'LARGE_FILE_BYTES', 0)
+    
+    # JSON is read whole, so the full in-memory summary is kept
+    result, _ = analyze_data(str(test_file))
+    rendered = str(result)
+    assert "Large file" not in rendered
+    assert "50%" in rendered
+
+def test_generate_batch_fills_every_slot():
+    from eda.llm.llm_analysis import generate_batch
+    import asyncio
+    in_flight = []
+    peak = []
+    
+    async def generate(model, prompt, stream):
+        in_flight.append(prompt)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(prompt)
+        return {'response': prompt.upper()}
+    
+    prompts = ['a' * n for n in (5, 1, 3, 2, 4, 6, 8, 7)]
+    with patch('ollama.AsyncClient') as mock_client:
+        mock_client.return_value.generate = AsyncMock(side_effect=generate)
+        outputs = generate_batch(prompts, 'llama3.2', max_concurrency=4)
+    
+    # Prompts of different lengths still run side by side, up to the concurrency limit
+    assert max(peak) == 4
+    assert outputs == [prompt.upper() for prompt in prompts]
@@ -0,0 +1,101 @@
+import pickle
+from datetime import datetime, timedelta, timezone
+import pandas as pd
+from unittest.mock import MagicMock
+from google.oauth2.credentials import Credentials
+from eda.data_readers import get_data_reader
+from eda.data_readers.google_sheets_reader import GoogleSheetsReader
+
+def test_csv_reader_matches_pandas(tmp_path):
+    test_file = tmp_path / "test.tsv"
+    test_file.write_text("A\tB\tC\tD\n1\tx\t1.5\t\n2\tNA\t\t\n3\tz\t2.5\t\n")
+    
+    df = get_data_reader(str(test_file)).read_data(str(test_file))
+    expected = pd.read_csv(test_file, delimiter='\t', dtype_backend='pyarrow')
+    # Entirely empty columns are read as float rather than Arrow's null type
+    expected['D'] = expected['D'].astype('double[pyarrow]')
+    # Low-cardinality string columns are read as categories
+    expected['B'] = pd.Categorical(['x', None, 'z'])
+    pd.testing.assert_frame_equal(df, expected)
+
+def test_json_reader_matches_pandas(tmp_path):
+    test_file = tmp_path / "test.json"
+    test_file.write_text('{"A": 1, "B": "x", "C": 1.5}\n{"A": 2, "B": null, "C": null}\n')
+    
+    df = get_data_reader(str(test_file)).read_data(str(test_file))
+    expected = pd.read_json(test_file, lines=True, dtype_backend='pyarrow')
+    pd.testing.assert_frame_equal(df, expected)
+
+def test_google_sheets_type_inference():
+    worksheet = MagicMock()
+    # Unformatted values: numbers come back typed, dates as formatted strings
+    worksheet.get_all_values.return_value = [
+        ['int', 'float', 'text', 'date', 'empty', 'mixed'],
+        [1, 1.5, 'x', '2023-01-01', '', 5],
+        [2, '', 3, '2023-02-03', '', '2023-01-01'],
+    ]
+    df = GoogleSheetsReader().get_sheet_as_df(worksheet)
+    assert df['int'].tolist() == [1, 2]
+    assert pd.api.types.is_float_dtype(df['float'])
+    assert df['float'].isna().sum() == 1
+    assert pd.api.types.is_string_dtype(df['text'])
+    assert df['text'].tolist() == ['x', '3']
+    assert pd.api.types.is_datetime64_any_dtype(df['date'])
+    assert df['empty'].isna().all()
+    assert df['mixed'].tolist() == ['5', '2023-01-01']
+
+def test_google_credentials_migrate_pickle_to_json(tmp_path, monkeypatch):
+    from eda.data_readers import google_sheets_reader
+    token_path = tmp_path / 'token.json'
+    legacy_path = tmp_path / 'token.pickle'
+    monkeypatch.setattr(google_sheets_reader, 'CREDENTIALS_DIR', tmp_path)
+    monkeypatch.setattr(google_sheets_reader, 'TOKEN_PATH', token_path)
+    monkeypatch.setattr(google_sheets_reader, 'LEGACY_TOKEN_PATH', legacy_path)
+    monkeypatch.setattr(google_sheets_reader, '_CACHED_CREDS', None)
+    
+    creds = Credentials(token='abc', refresh_token='def', client_id='id', client_secret='secret',
+                        token_uri='https://oauth2.googleapis.com/token', scopes=google_sheets_reader.SCOPES,
+                        expiry=datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(hours=1))
+    with open(legacy_path, 'wb') as token:
+        pickle.dump(creds, token)
+    
+    loaded = GoogleSheetsReader().get_google_credentials()
+    assert loaded.token == 'abc'
+    assert token_path.exists()
+    assert not legacy_path.exists()
+    
+    # Later calls in the same process reuse the loaded credentials
+    assert GoogleSheetsReader().get_google_credentials() is loaded
+    
+    monkeypatch.setattr(google_sheets_reader, '_CACHED_CREDS', None)
+    reloaded = GoogleSheetsReader().get_google_credentials()
+    assert reloaded.refresh_token == 'def'
+
+def test_parquet_reader_reads_selected_columns(tmp_path):
+    test_file = tmp_path / "test.parquet"
+    pd.DataFrame({'A': [1, 2], 'B': ['x', None], 'C': [1.5, 2.5]}).to_parquet(test_file)
+    
+    reader = get_data_reader(str(test_file))
+    pd.testing.assert_frame_equal(reader.read_data(str(test_file)),
+                                  pd.read_parquet(test_file, dtype_backend='pyarrow'))
+    assert list(reader.read_data(str(test_file), columns=['C', 'A']).columns) == ['C', 'A']
+
+def test_csv_reader_chunks_tolerate_type_drift(tmp_path, monkeypatch):
+    from eda.data_readers import csv_reader
+    # Tiny blocks so later chunks disagree with the types inferred from the first one
+    monkeypatch.setattr(csv_reader, 'CHUNK_BYTES', 1024)
+    n = 300
+    ints = [str(i) for i in range(n)]
+    ints[-1] = '1.5'
+    empty_then_filled = [''] * 100 + [str(i) for i in range(n - 100)]
+    many_strings = [f'value{i}' for i in range(n)]
+    test_file = tmp_path / "test.csv"
+    test_file.write_text("I,E,S\n" + "".join(f"{a},{b},{c}\n" for a, b, c in zip(ints, empty_then_filled, many_strings)))
+    
+    chunks = list(get_data_reader(str(test_file)).iter_chunks(str(test_file)))
+    assert len(chunks) > 1
+    assert sum(len(chunk) for chunk in chunks) == n
+    assert all(pd.api.types.is_numeric_dtype(chunk['I']) for chunk in chunks)
+    assert pd.concat([chunk['I'].astype(float) for chunk in chunks]).sum() == sum(range(n - 1)) + 1.5
+    assert sum(chunk['E'].notna().sum() for chunk in chunks) == n - 100
+    assert sum(chunk['S'].nunique() for chunk in chunks) == n
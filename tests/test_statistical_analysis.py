@@ -0,0 +1,179 @@
+import warnings
+import pytest
+import numpy as np
+import pandas as pd
+from eda.analysis.statistical_analysis import (
+    calculate_correlations, detect_outliers, perform_statistical_tests, summary_statistics, streaming_summary
+)
+
+def test_calculate_correlations_matches_pandas():
+    df = pd.DataFrame({
+        'A': [1.0, 2.0, 3.0, 4.0, 5.0],
+        'B': [2.0, 4.1, 5.9, 8.2, 9.8],
+        'C': [5, 3, 4, 1, 2],
+        'D': ['a', 'b', 'c', 'd', 'e']
+    })
+    result = calculate_correlations(df)
+    expected = df[['A', 'B', 'C']].corr()
+    assert list(result.columns) == ['A', 'B', 'C']
+    np.testing.assert_allclose(result.to_numpy(), expected.to_numpy())
+
+def test_calculate_correlations_two_columns_with_missing_values():
+    df = pd.DataFrame({
+        'A': [1.0, 2.0, np.nan, 4.0],
+        'B': [1.0, 3.0, 2.0, 5.0]
+    })
+    result = calculate_correlations(df)
+    expected = df.corr()
+    np.testing.assert_allclose(result.to_numpy(), expected.to_numpy())
+
+def test_calculate_correlations_rank_methods():
+    df = pd.DataFrame({
+        'A': [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+        'B': [1.0, 8.0, 27.0, 20.0, 125.0, 216.0],
+        'C': [6, 5, 4, 1, 3, 2]
+    })
+    for method in ('spearman', 'kendall'):
+        result = calculate_correlations(df, method=method)
+        np.testing.assert_allclose(result.to_numpy(), df.corr(method=method).to_numpy())
+
+def test_detect_outliers():
+    values = [10.0] * 20 + [100.0]
+    df = pd.DataFrame({
+        'A': values,
+        'B': [1.0] * 21,
+        'C': [np.nan] + values[1:]
+    })
+    outliers = detect_outliers(df)
+    assert list(outliers['A']) == [100.0]
+    assert len(outliers['B']) == 0
+    assert list(outliers['C']) == [100.0]
+
+def test_detect_outliers_all_nan_column_is_silent():
+    df = pd.DataFrame({'A': [1.0, 2.0, 3.0], 'B': [np.nan] * 3})
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        outliers = detect_outliers(df)
+    assert len(outliers['B']) == 0
+
+def test_perform_statistical_tests_reports_insufficient_data():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({'A': rng.normal(size=50), 'B': [1.0, 2.0, 3.0] + [np.nan] * 47})
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        output = perform_statistical_tests(df)
+    a_section, b_section = output.split("B Normality Test:")
+    assert "P-value" in a_section
+    assert "Insufficient data" in b_section
+    assert "nan" not in output
+
+def test_summary_statistics_matches_describe():
+    df = pd.DataFrame({
+        'A': [1.0, 2.0, np.nan, 4.0],
+        'B': ['x', 'y', 'x', None],
+        'C': [3, 1, 2, 5],
+        'D': pd.Categorical(['a', 'b', 'a', None], categories=['a', 'b', 'c'])
+    })
+    assert summary_statistics(df).to_string() == df.describe(include='all').to_string()
+
+def test_summary_statistics_datetime_columns_match_describe():
+    df = pd.DataFrame({
+        'A': [1.0, 2.0, np.nan, 4.0],
+        'T': pd.to_datetime(['2024-01-01', '2024-03-01', None, '2024-02-01']),
+        'B': ['x', 'y', 'x', None]
+    })
+    result = summary_statistics(df)
+    expected = df.describe(include='all')
+    assert result.loc['min', 'T'] == pd.Timestamp('2024-01-01')
+    assert pd.isna(result.loc['top', 'T'])
+    assert result.to_string() == expected.reindex(result.index).to_string()
+
+def test_streaming_summary_matches_in_memory():
+    df = pd.DataFrame({
+        'A': [1.0, 2.0, np.nan, 4.0, 8.0, 3.0],
+        'B': ['x', 'y', None, 'x', 'z', 'y'],
+        'C': [3, 1, 2, 5, 7, 6]
+    })
+    sample, n_rows, missing, summary = streaming_summary(df.iloc[i:i + 2] for i in range(0, len(df), 2))
+    assert n_rows == 6
+    assert len(sample) == 2
+    pd.testing.assert_series_equal(missing, df.isna().sum())
+    expected = summary_statistics(df)
+    np.testing.assert_allclose(summary.loc[['count', 'mean', 'std', 'min', 'max'], ['A', 'C']].to_numpy(dtype=float),
+                               expected.loc[['count', 'mean', 'std', 'min', 'max'], ['A', 'C']].to_numpy(dtype=float))
+    assert summary.loc['count', 'B'] == 5
+
+def test_calculate_correlations_keeps_float32():
+    df = pd.DataFrame({
+        'A': np.array([1.0, 2.0, 3.0, 4.0], dtype=np.float32),
+        'B': np.array([2.0, 4.5, 5.5, 9.0], dtype=np.float32)
+    })
+    result = calculate_correlations(df)
+    assert (result.dtypes == np.float32).all()
+    np.testing.assert_allclose(result.to_numpy(), df.astype(np.float64).corr().to_numpy(), rtol=1e-5)
+
+def test_zscore_mask_numba_matches_numpy():
+    pytest.importorskip('numba')
+    from eda.analysis._numba_kernels import zscore_mask
+    from eda.analysis.statistical_analysis import _zscore_mask_numpy
+    rng = np.random.default_rng(0)
+    arr = rng.standard_t(3, size=(500, 4))
+    arr[::7, 1] = np.nan
+    arr[:, 3] = 1.0
+    np.testing.assert_array_equal(zscore_mask(arr, 3.0), _zscore_mask_numpy(arr, 3.0))
+
+def test_zscore_mask_uses_numba_only_for_large_arrays(monkeypatch):
+    import sys
+    import types
+    from eda.analysis import statistical_analysis
+    calls = []
+    kernels = types.ModuleType('eda.analysis._numba_kernels')
+    kernels.zscore_mask = lambda arr, threshold: calls.append(arr.size) or np.zeros(arr.shape, dtype=bool)
+    monkeypatch.setitem(sys.modules, 'eda.analysis._numba_kernels', kernels)
+    arr = np.arange(12.0).reshape(6, 2)
+    
+    statistical_analysis._zscore_mask(arr, 3.0)
+    assert calls == []
+    monkeypatch.setattr(statistical_analysis, 'NUMBA_MIN_SIZE', arr.size)
+    statistical_analysis._zscore_mask(arr, 3.0)
+    assert calls == [arr.size]
+
+def test_classify_columns_handles_arrow_and_nullable_dtypes():
+    from eda.analysis.column_types import classify_columns
+    df = pd.DataFrame({
+        'a': pd.array([1, 2], dtype='int64[pyarrow]'),
+        'b': np.array([1.0, 2.0], dtype=np.float32),
+        'c': pd.array([1, None], dtype='Int64'),
+        'd': ['x', 'y'],
+        'e': pd.Categorical(['x', 'y']),
+        'f': pd.array(['x', 'y'], dtype='string[pyarrow]'),
+        'g': [True, False],
+        'h': pd.to_datetime(['2023-01-01', '2023-01-02'])
+    })
+    numeric_cols, cat_cols = classify_columns(df)
+    assert list(numeric_cols) == ['a', 'b', 'c']
+    assert list(cat_cols) == ['d', 'e', 'f']
+
+def test_summary_statistics_float32_matches_describe():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(10, 2, size=(200, 3)).astype(np.float32), columns=['A', 'B', 'C'])
+    df.iloc[::9, 1] = np.nan
+    np.testing.assert_allclose(summary_statistics(df).to_numpy(dtype=np.float64),
+                               df.describe().to_numpy(dtype=np.float64), rtol=1e-5)
+
+def test_summary_statistics_without_rows():
+    df = pd.DataFrame({'A': pd.Series([], dtype=float), 'B': pd.Series([], dtype=object)})
+    summary = summary_statistics(df)
+    assert list(summary.loc['count']) == [0, 0]
+    assert np.isnan(summary.loc['mean', 'A'])
+
+def test_calculate_correlations_pairwise_missing_values():
+    df = pd.DataFrame({
+        'A': [1.0, 2.0, np.nan, 4.0, 5.0],
+        'B': [2.0, np.nan, 3.0, 7.0, 9.0],
+        'C': [5.0, 3.0, 4.0, 1.0, 2.0],
+        'D': [np.nan] * 5
+    })
+    for method in ('pearson', 'spearman', 'kendall'):
+        result = calculate_correlations(df, method=method)
+        np.testing.assert_allclose(result.to_numpy(), df.corr(method=method).to_numpy())